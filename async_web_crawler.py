@@ -1,98 +1,246 @@
 # crawler/async_web_crawler.py
-from typing import Dict, Optional, List
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, BrowserConfig
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, CacheMode, BrowserConfig, CrawlResult, LLMExtractionStrategy
 from base_scraper import BaseScraper, WebContent, ContentType
 from llm_extraction import (
     get_llm_strategy_for_content_type,
     get_generic_llm_strategy,
     process_llm_extracted_data,
-    check_no_results_llm
+    check_no_results_llm,
+    content_fingerprint,
+    fingerprint_similarity
 )
 import asyncio
+import contextlib
+import re
+import sys
+from urllib.parse import urlparse
+
+# Link schemes worth following
+_URL_SCHEMES = ("http://", "https://")
+
+# Common empty-state messages, checked before the fuller no-results detection
+_NO_RESULTS_RE = re.compile(
+    r"\b(no (results|matches|items) found|sorry.{0,20}nothing|0 results|page not found)\b",
+    re.IGNORECASE
+)
+# Empty-state messages live near the end of the page, only its tail is checked
+_NO_RESULTS_TAIL_BYTES = 8192
 
 class AsyncWebScraper(BaseScraper):
     def __init__(self, url: str, config: Optional[Dict] = None):
         super().__init__(url, config)
         self.crawler = None
         self.browser_config = None
+        # host -> (available tokens, last refill time on the event loop clock)
+        self._host_buckets: Dict[str, Tuple[float, float]] = {}
+        # (host, content_type) -> {content fingerprint: extracted items}
+        self._llm_cache: Dict[tuple, "OrderedDict[int, List[Dict]]"] = {}
+        # Progress messages, written to stdout by a background task while open
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_task: Optional[asyncio.Task] = None
+        # CrawlResult attribute holding the page content, resolved in __aenter__
+        self._content_attr = "cleaned_html"
     
     def _get_browser_config(self) -> BrowserConfig:
-        """Get browser configuration matching the original implementation"""
+        """Get the browser configuration shared by every request of this scraper"""
         browser_config_dict = self.config.get("browser_config", {})
         return BrowserConfig(
             browser_type=browser_config_dict.get("browser_type", "chromium"),
-            headless=browser_config_dict.get("headless", False),
-            verbose=browser_config_dict.get("verbose", True)
+            headless=browser_config_dict.get("headless", True),
+            verbose=browser_config_dict.get("verbose", True),
+            use_persistent_context=browser_config_dict.get("use_persistent_context", False),
+            user_data_dir=browser_config_dict.get("user_data_dir")
         )
     
+    def _cache_mode(self) -> CacheMode:
+        """Get the crawl4ai cache mode, forcing a refetch when ``fresh`` is set"""
+        if self.config.get("fresh"):
+            return CacheMode.BYPASS
+        return CacheMode(self.config.get("cache_mode", "enabled"))
+    
     async def scrape_with_pagination(self, 
                                    base_url: str = None,
                                    max_pages: int = 10,
                                    use_llm: bool = True,
                                    content_type: ContentType = None,
                                    follow_links: bool = False,
-                                   max_links_per_page: int = 5) -> List[Dict]:
-        """Scrape multiple pages with pagination support and optional deep link extraction"""
+                                   max_links_per_page: int = 5,
+                                   semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+        """Scrape multiple pages with pagination support and optional deep link extraction
+
+        All page URLs are dispatched concurrently and then post-processed in
+        page order. At most ``max_concurrency`` pages are fetched by the
+        browser at once, and at most ``max_concurrency + prefetch_pages``
+        pages are started ahead of the page being post-processed; a page
+        only frees its slot once it has been handled here. The first empty
+        page terminates the result set and cancels the work still running
+        for later pages, so at most that many pages are scraped past it.
+        
+        Passing ``semaphore`` shares one cap on browser fetches between pages
+        and followed links. Pages in flight are still limited by
+        ``max_concurrency`` plus ``prefetch_pages``, and links by
+        ``link_concurrency``, so those should be at least as large as the
+        semaphore for it to be the effective limit.
+        """
         if not base_url:
             base_url = self.url
         
+        separator = "&" if "?" in base_url else "?"
+        page_urls = [f"{base_url}{separator}page={page_number}" for page_number in range(1, max_pages + 1)]
+        
+        session_id = self.config.get("session_id", "default_session")
+        max_concurrency = self.config.get("max_concurrency", 5)
+        # Browser fetches in flight, held only while navigating
+        fetch_sem = semaphore or asyncio.BoundedSemaphore(max_concurrency)
+        # Pages started but not yet handled by the loop below, acquired by each
+        # page task and released by the loop once it is done with that page
+        window_size = max_concurrency + self.config.get("prefetch_pages", 1)
+        window = asyncio.Semaphore(window_size)
+        # One browser session per window slot, reused across pages, so a run
+        # never leaves more pages open than it has in flight
+        session_slots = asyncio.Queue()
+        for slot in range(window_size):
+            session_slots.put_nowait(f"{session_id}_page_{slot}")
+        
+        async def _one(page_number: int, url: str):
+            # Released by the consumer loop, not here, so pages can't run
+            # further ahead of it than the window allows
+            await window.acquire()
+            self._log(f"Scraping page {page_number}: {url}")
+            # Concurrent pages get their own sessions so they don't
+            # navigate over each other
+            slot_session = session_slots.get_nowait()
+            try:
+                return await self.scrape(
+                    use_llm=use_llm,
+                    content_type=content_type,
+                    url=url,
+                    session_id=slot_session,
+                    fetch_semaphore=fetch_sem
+                )
+            except Exception as e:
+                # Returned rather than raised so one failed page doesn't
+                # tear down the whole task group
+                return e
+            finally:
+                session_slots.put_nowait(slot_session)
+        
         all_items = []
-        page_number = 1
         
-        while page_number <= max_pages:
-            # Construct URL with page parameter
-            if "?" in base_url:
-                url = f"{base_url}&page={page_number}"
-            else:
-                url = f"{base_url}?page={page_number}"
-            
-            print(f"Scraping page {page_number}: {url}")
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_one(page_number, url))
+                for page_number, url in enumerate(page_urls, start=1)
+            ]
             
-            # Update URL for this page
-            original_url = self.url
-            self.url = url
-            
-            try:
-                # Scrape the page
-                content = await self.scrape(use_llm=use_llm, content_type=content_type)
-                
-                # Check for no results
-                if content.content and await check_no_results_llm(content.content):
-                    print(f"No more results found on page {page_number}")
-                    break
-                
-                # Add structured data if available
-                if content.structured_data:
-                    page_items = content.structured_data.copy()
-                    
-                    # Follow links if requested
-                    if follow_links:
-                        page_items = await self._extract_from_links(
-                            page_items, max_links_per_page, use_llm, content_type
-                        )
+            for page_number, task in enumerate(tasks, start=1):
+                try:
+                    content = await task
                     
-                    all_items.extend(page_items)
-                    print(f"Found {len(page_items)} items on page {page_number}")
-                else:
-                    print(f"No structured data found on page {page_number}")
-                    # If no structured data and we're using LLM, might be end of results
-                    if use_llm:
+                    if isinstance(content, Exception):
+                        self._log(f"Error scraping page {page_number}: {content}")
                         break
-                
-                page_number += 1
-                
-            except Exception as e:
-                print(f"Error scraping page {page_number}: {e}")
-                break
-            finally:
-                # Restore original URL
-                self.url = original_url
+                    
+                    # Check for no results, cheaply on the page tail first and only
+                    # falling back to the full check when nothing was extracted
+                    if content.content_bytes:
+                        tail = content.content_bytes[-_NO_RESULTS_TAIL_BYTES:].decode("utf-8", "ignore")
+                        if _NO_RESULTS_RE.search(tail) or (
+                            not content.structured_data and await check_no_results_llm(content.content_bytes)
+                        ):
+                            self._log(f"No more results found on page {page_number}")
+                            break
+                    
+                    # Add structured data if available
+                    if content.structured_data:
+                        page_items = content.structured_data
+                    
+                        # Follow links if requested
+                        if follow_links:
+                            page_items = await self._extract_from_links(
+                                page_items, max_links_per_page, use_llm, content_type,
+                                fetch_semaphore=semaphore
+                            )
+                    
+                        all_items.extend(page_items)
+                        self._log(f"Found {len(page_items)} items on page {page_number}")
+                    else:
+                        self._log(f"No structured data found on page {page_number}")
+                        # If no structured data and we're using LLM, might be end of results
+                        if use_llm:
+                            break
+                finally:
+                    # The page has been handled, let the next one start
+                    window.release()
+            
+            # Pages past the end of the results are no longer needed
+            for task in tasks:
+                task.cancel()
         
-        print(f"Total items extracted: {len(all_items)}")
+        self._log(f"Total items extracted: {len(all_items)}")
         return all_items
     
+    async def scrape_url(self,
+                         url: str,
+                         use_llm: bool = False,
+                         content_type: ContentType = None,
+                         session_id: Optional[str] = None) -> WebContent:
+        """Scrape an arbitrary URL with this scraper's open browser
+
+        Open one scraper per application and route every fetch through it:
+        the crawler started in ``__aenter__`` (and its browser context) is
+        reused, so there is no cold browser start per URL.
+        """
+        return await self.scrape(
+            use_llm=use_llm,
+            content_type=content_type,
+            url=url,
+            session_id=session_id
+        )
+    
+    def _log(self, message: str) -> None:
+        """Queue a progress message without blocking the event loop on stdout"""
+        if self._log_queue is None:
+            print(message)
+        else:
+            self._log_queue.put_nowait(message)
+    
+    async def _drain_logs(self) -> None:
+        """Write queued progress messages to stdout, batching what's pending"""
+        while True:
+            messages = [await self._log_queue.get()]
+            while not self._log_queue.empty():
+                messages.append(self._log_queue.get_nowait())
+            sys.stdout.write("\n".join(messages) + "\n")
+            sys.stdout.flush()
+    
+    async def _stop_log_writer(self) -> None:
+        """Stop the log writer task and flush anything it didn't get to"""
+        if self._log_task:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+        
+        if self._log_queue is not None:
+            while not self._log_queue.empty():
+                print(self._log_queue.get_nowait())
+            self._log_queue = None
+    
     async def __aenter__(self):
         """Initialize the crawler when entering the context"""
+        self._log_queue = asyncio.Queue()
+        self._log_task = asyncio.create_task(self._drain_logs())
+        # CrawlResult's fields are fixed per crawl4ai version, so pick the
+        # preferred content attribute once instead of probing every result
+        self._content_attr = next(
+            (name for name in ("cleaned_html", "markdown", "html") if name in CrawlResult.model_fields),
+            "html"
+        )
         try:
             self.browser_config = self._get_browser_config()
             # Create the crawler but don't initialize it yet - let the context manager handle it
@@ -101,6 +249,7 @@ class AsyncWebScraper(BaseScraper):
             await self.crawler.__aenter__()
             return self
         except Exception as e:
+            await self._stop_log_writer()
             print(f"Error initializing crawler: {str(e)}")
             raise
 
@@ -111,6 +260,8 @@ class AsyncWebScraper(BaseScraper):
                 await self.crawler.__aexit__(exc_type, exc_val, exc_tb)
             except Exception as e:
                 print(f"Error during crawler cleanup: {str(e)}")
+            self.crawler = None
+        await self._stop_log_writer()
     
     async def check_no_results(self, url: str = None) -> bool:
         """Check if a page indicates no results are available"""
@@ -120,22 +271,18 @@ class AsyncWebScraper(BaseScraper):
             result = await self.crawler.arun(
                 url=check_url,
                 config=CrawlerRunConfig(
-                    cache_mode=CacheMode.BYPASS,
+                    # Emptiness is structural, a cached copy is good enough
+                    cache_mode=CacheMode.ENABLED,
                     session_id=self.config.get("session_id", "default_session")
                 )
             )
             
             if result.success:
-                content = ""
-                if hasattr(result, 'cleaned_html'):
-                    content = result.cleaned_html
-                elif hasattr(result, 'markdown'):
-                    content = result.markdown
-                
+                content = getattr(result, self._content_attr, None) or ""
                 return await check_no_results_llm(content)
             
         except Exception as e:
-            print(f"Error checking for no results: {e}")
+            self._log(f"Error checking for no results: {e}")
         
         return False
     
@@ -143,16 +290,26 @@ class AsyncWebScraper(BaseScraper):
                                 items: List[Dict], 
                                 max_links_per_page: int,
                                 use_llm: bool,
-                                content_type: ContentType) -> List[Dict]:
-        """Extract additional data by following links in the items"""
+                                content_type: ContentType,
+                                fetch_semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+        """Extract additional data by following links in the items
+
+        Links from all items are fetched concurrently (bounded by the
+        ``link_concurrency`` config value, and by ``fetch_semaphore`` when
+        given); requests to the same host are rate limited by a per-host
+        token bucket.
+        """
         if not items or max_links_per_page <= 0:
             return items
             
         enhanced_items = []
+        # (item index, link) pairs across all items
+        pairs = []
         
-        for item in items:
+        for index, item in enumerate(items):
             enhanced_item = item.copy()
             enhanced_item['extracted_from_links'] = []
+            enhanced_items.append(enhanced_item)
             
             # Extract links from the item or its structured_data
             links = []
@@ -168,71 +325,218 @@ class AsyncWebScraper(BaseScraper):
                 links = item['links']
             
             if not links:
-                enhanced_items.append(enhanced_item)
                 continue
             
-            # Filter out None or empty links and ensure they're strings
-            links = [str(link) for link in links if link and str(link).startswith(('http://', 'https://'))]
-            
-            # Filter out duplicate links while preserving order
-            seen_links = set()
-            unique_links = []
-            for link in links:
-                if link not in seen_links:
-                    seen_links.add(link)
-                    unique_links.append(link)
+            # Keep non-empty http(s) links as strings, dropping duplicates while
+            # preserving order
+            unique_links = list(dict.fromkeys(
+                link_str for link in links if link and (link_str := str(link)).startswith(_URL_SCHEMES)
+            ))
             
             # Limit the number of links to follow
-            links_to_follow = unique_links[:max_links_per_page]
-            
-            for link in links_to_follow:
+            pairs.extend((index, link) for link in unique_links[:max_links_per_page])
+        
+        if not pairs:
+            return enhanced_items
+        
+        concurrency = self.config.get("link_concurrency", 5)
+        sem = asyncio.Semaphore(concurrency)
+        # One browser session per concurrent slot, reused across links
+        session_id = self.config.get("session_id", "default_session")
+        session_slots = asyncio.Queue()
+        for slot in range(concurrency):
+            session_slots.put_nowait(f"{session_id}_link_{slot}")
+        
+        async def fetch_link(link: str) -> WebContent:
+            async with sem:
+                slot_session = session_slots.get_nowait()
                 try:
-                    print(f"  Following link: {link}")
-                    
-                    # Create a temporary scraper for this link
-                    original_url = self.url
-                    self.url = link
-                    
-                    # Scrape the linked page
-                    link_content = await self.scrape(use_llm=use_llm, content_type=content_type)
-                    
-                    # Add the extracted data
-                    link_data = {
-                        'url': link,
-                        'title': link_content.title,
-                        'description': link_content.description,
-                        'content_length': len(link_content.content) if link_content.content else 0,
-                        'structured_data': link_content.structured_data
-                    }
-                    
-                    enhanced_item['extracted_from_links'].append(link_data)
-                    
-                    # Restore original URL
-                    self.url = original_url
-                    
-                    # Add a small delay to be respectful
-                    await asyncio.sleep(1)
-                    
-                except Exception as e:
-                    print(f"    Error following link {link}: {e}")
-                    # Restore original URL in case of error
-                    self.url = original_url
-                    continue
+                    self._log(f"  Following link: {link}")
+                    # Be respectful to hosts we hit repeatedly
+                    return await self.scrape(
+                        use_llm=use_llm,
+                        content_type=content_type,
+                        url=link,
+                        session_id=slot_session,
+                        fetch_semaphore=fetch_semaphore,
+                        throttle=True
+                    )
+                finally:
+                    session_slots.put_nowait(slot_session)
+        
+        results = await asyncio.gather(
+            *(fetch_link(link) for _, link in pairs),
+            return_exceptions=True
+        )
+        
+        for (index, link), link_content in zip(pairs, results):
+            if isinstance(link_content, BaseException):
+                self._log(f"    Error following link {link}: {link_content}")
+                continue
             
-            enhanced_items.append(enhanced_item)
+            # Add the extracted data
+            enhanced_items[index]['extracted_from_links'].append({
+                'url': link,
+                'title': link_content.title,
+                'description': link_content.description,
+                'content_length': len(link_content.content_bytes) if link_content.content_bytes else 0,
+                'structured_data': link_content.structured_data
+            })
         
         return enhanced_items
 
-    async def scrape(self, use_llm: bool = False, content_type: ContentType = None) -> WebContent:
-        """Scrape the webpage using crawl4ai with optional LLM extraction"""
+    async def _throttle_host(self, url: str) -> None:
+        """Rate limit requests per host with a token bucket
+
+        Each host refills at ``per_host_rps`` tokens per second up to
+        ``per_host_burst``; requests to distinct hosts never wait on each other.
+        """
+        rate = self.config.get("per_host_rps", 2.0)
+        burst = self.config.get("per_host_burst", 4)
+        host = urlparse(url).netloc
+        now = asyncio.get_running_loop().time()
+        
+        tokens, last_refill = self._host_buckets.get(host, (burst, now))
+        tokens = min(burst, tokens + (now - last_refill) * rate)
+        # Take the token up front (possibly going into debt) so that
+        # concurrent callers queue up behind each other
+        tokens -= 1
+        self._host_buckets[host] = (tokens, now)
+        if tokens < 0:
+            await asyncio.sleep(-tokens / rate)
+
+    async def _extract_with_llm(self,
+                                url: str,
+                                result: CrawlResult,
+                                llm_strategy: LLMExtractionStrategy,
+                                run_config: CrawlerRunConfig,
+                                content_type: ContentType) -> List[Dict]:
+        """Run LLM extraction on a crawl result, reusing near-duplicate extractions
+
+        When ``semantic_cache`` is enabled, the LLM input is fingerprinted and
+        compared against earlier extractions for the same host and content
+        type; a match above ``semantic_cache_threshold`` skips the LLM call.
+        """
+        if llm_strategy.input_format == "html":
+            llm_input = result.html or ""
+            sections = [llm_input]
+        else:
+            llm_input = result.markdown if isinstance(result.markdown, str) else getattr(result.markdown, "raw_markdown", "")
+            llm_input = llm_input or ""
+            sections = run_config.chunking_strategy.chunk(llm_input)
+        
+        bucket = None
+        fingerprint = None
+        if self.config.get("semantic_cache", False):
+            bucket = (urlparse(url).netloc, content_type)
+            # Hashing every shingle is pure Python and takes a noticeable
+            # slice of a second on large pages, keep it off the event loop
+            fingerprint = await asyncio.to_thread(content_fingerprint, llm_input)
+            cached = self._lookup_llm_cache(bucket, fingerprint)
+            if cached is not None:
+                self._log(f"Reusing LLM extraction for near-duplicate page: {url}")
+                return cached
+        
+        # LLMExtractionStrategy.run is blocking, keep it off the event loop
+        extracted = await asyncio.to_thread(llm_strategy.run, url, sections)
+        extracted_items = process_llm_extracted_data(extracted, content_type)
+        
+        if bucket is not None and extracted_items:
+            entries = self._llm_cache.setdefault(bucket, OrderedDict())
+            entries[fingerprint] = extracted_items
+            if len(entries) > self.config.get("semantic_cache_size", 100):
+                entries.pop(next(iter(entries)))
+        
+        return extracted_items
+
+    def _lookup_llm_cache(self, bucket: tuple, fingerprint: int) -> Optional[List[Dict]]:
+        """Return the cached extraction most similar to a fingerprint, if close enough"""
+        entries = self._llm_cache.get(bucket)
+        if not entries:
+            return None
+        
+        threshold = self.config.get("semantic_cache_threshold", 0.95)
+        best_key, best_score = None, 0.0
+        for key in entries:
+            score = fingerprint_similarity(fingerprint, key)
+            if score > best_score:
+                best_key, best_score = key, score
+        
+        if best_score < threshold:
+            return None
+        entries.move_to_end(best_key)
+        return entries[best_key]
+
+    async def _process_result(self,
+                              url: str,
+                              result: CrawlResult,
+                              llm_strategy: Optional[LLMExtractionStrategy],
+                              run_config: CrawlerRunConfig,
+                              content_type: Optional[ContentType]) -> WebContent:
+        """Build a WebContent from a crawl result in a single pass"""
+        metadata = result.metadata or {}
+        content = getattr(result, self._content_attr, None)
+        
+        # Run LLM extraction if requested
+        structured_data = None
+        if llm_strategy:
+            extracted_items = await self._extract_with_llm(
+                url,
+                result,
+                llm_strategy,
+                run_config,
+                content_type or ContentType.UNKNOWN
+            )
+            if extracted_items:
+                structured_data = extracted_items
+                self._log(f"LLM extracted {len(extracted_items)} items")
+        
+        return WebContent(
+            url=url,
+            title=metadata.get("title", "No title found"),
+            description=metadata.get("description", ""),
+            content_bytes=content.encode("utf-8", "ignore") if content else None,
+            # Detect content type if not provided
+            content_type=content_type or self.detect_content_type(url),
+            structured_data=structured_data
+        )
+
+    async def scrape(self,
+                     use_llm: bool = False,
+                     content_type: ContentType = None,
+                     url: Optional[str] = None,
+                     session_id: Optional[str] = None,
+                     fetch_semaphore: Optional[asyncio.Semaphore] = None,
+                     throttle: bool = False) -> WebContent:
+        """Scrape a webpage using crawl4ai with optional LLM extraction
+
+        Args:
+            use_llm: Whether to run LLM-based structured data extraction
+            content_type: Content type used to pick the extraction model
+            url: URL to scrape, defaults to the scraper's own URL
+            session_id: Browser session to use, defaults to the configured one
+            fetch_semaphore: Held only while the browser fetches the page, so
+                LLM extraction doesn't block other fetches sharing it
+            throttle: Rate limit the fetch with the per-host token bucket;
+                results served from the cache don't use up tokens
+        """
+        target_url = url or self.url
+        
         if not self.crawler:
             return WebContent(
-                url=self.url,
+                url=target_url,
                 title="Error: Crawler not initialized",
                 description="Crawler must be used within an async context manager",
                 content_type=ContentType.UNKNOWN
             )
         
+        cache_key = None
+        if self.config.get("enable_cache", True):
+            cache_key = (target_url, use_llm, content_type, self.config.get("css_selector"))
+            cached = None if self.config.get("fresh") else self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # Determine if we should use LLM extraction
             llm_strategy = None
@@ -244,63 +548,45 @@ class AsyncWebScraper(BaseScraper):
             
             # Configure crawler run
             config_params = {
-                "cache_mode": CacheMode.BYPASS,
-                "session_id": self.config.get("session_id", "default_session")
+                "cache_mode": self._cache_mode(),
+                "session_id": session_id or self.config.get("session_id", "default_session")
             }
             
-            # Add LLM strategy if available
-            if llm_strategy:
-                config_params["extraction_strategy"] = llm_strategy
-            
             # Add CSS selector if provided
             css_selector = self.config.get("css_selector")
             if css_selector:
                 config_params["css_selector"] = css_selector
             
-            result = await self.crawler.arun(
-                url=self.url,
-                config=CrawlerRunConfig(**config_params)
-            )
+            # The LLM strategy is not handed to crawl4ai: extraction runs
+            # separately so near-duplicate pages can reuse earlier results
+            run_config = CrawlerRunConfig(**config_params)
+            # Waited for before taking a fetch slot, so a throttled host
+            # doesn't hold up fetches to other hosts
+            if throttle:
+                await self._throttle_host(target_url)
+            async with fetch_semaphore or contextlib.nullcontext():
+                result = await self.crawler.arun(
+                    url=target_url,
+                    config=run_config
+                )
             
             if not result.success:
-                raise Exception(f"Failed to scrape {self.url}: {result.error_message}")
-            
-            # Extract basic content
-            content = ""
-            if hasattr(result, 'cleaned_html'):
-                content = result.cleaned_html
-            elif hasattr(result, 'markdown'):
-                content = result.markdown
-            elif hasattr(result, 'html'):
-                content = result.html
+                raise Exception(f"Failed to scrape {target_url}: {result.error_message}")
             
-            # Process LLM extracted data if available
-            structured_data = None
-            if llm_strategy and hasattr(result, 'extracted_content') and result.extracted_content:
-                extracted_items = process_llm_extracted_data(
-                    result.extracted_content,
-                    content_type or ContentType.UNKNOWN
-                )
-                if extracted_items:
-                    structured_data = extracted_items
-                    print(f"LLM extracted {len(extracted_items)} items")
+            web_content = await self._process_result(
+                target_url, result, llm_strategy, run_config, content_type
+            )
             
-            # Detect content type if not provided
-            detected_content_type = content_type or await self.detect_content_type()
+            # Only successful results are cached
+            if cache_key is not None:
+                self._cache_result(cache_key, web_content)
             
-            return WebContent(
-                url=self.url,
-                title=result.metadata.get("title", "No title found"),
-                description=result.metadata.get("description", ""),
-                content=content,
-                content_type=detected_content_type,
-                structured_data=structured_data
-            )
+            return web_content
             
         except Exception as e:
-            print(f"Error during scraping: {str(e)}")
+            self._log(f"Error during scraping: {str(e)}")
             return WebContent(
-                url=self.url,
+                url=target_url,
                 title=f"Error: {str(e)}",
                 description="An error occurred during scraping",
                 content_type=ContentType.UNKNOWN
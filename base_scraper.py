@@ -1,10 +1,11 @@
 # base_scraper.py
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional, TypeVar, Generic, Type
-from pydantic import BaseModel, Field
-from dataclasses import dataclass
 from enum import Enum
+import functools
 import json
+import re
 
 class ContentType(str, Enum):
     ARTICLE = "article"
@@ -13,33 +14,64 @@ class ContentType(str, Enum):
     PROFILE = "profile"
     UNKNOWN = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class WebContent:
     url: str
     title: str = "Untitled"
     description: Optional[str] = None
-    content: Optional[str] = None
-    metadata: Dict = Field(default_factory=dict)
-    links: List[Dict] = Field(default_factory=list)
-    images: List[Dict] = Field(default_factory=list)
+    content_bytes: Optional[bytes] = None
+    metadata: Dict = field(default_factory=dict)
+    links: List[Dict] = field(default_factory=list)
+    images: List[Dict] = field(default_factory=list)
     content_type: ContentType = ContentType.UNKNOWN
     structured_data: Optional[Dict] = None
+    
+    @property
+    def content(self) -> Optional[str]:
+        """Page content as text, decoded from ``content_bytes`` on each access"""
+        if self.content_bytes is None:
+            return None
+        return self.content_bytes.decode("utf-8", "ignore")
+
+# URL path segments that identify a content type
+_CONTENT_TYPE_PATH_RE = re.compile(r"/(product|article|profile|listing)/", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def _detect_content_type_cached(url: str) -> ContentType:
+    """Detect the content type from the URL path"""
+    # This is a simplified example - you'd want to make this more sophisticated
+    match = _CONTENT_TYPE_PATH_RE.search(url)
+    if match:
+        return ContentType(match.group(1).lower())
+    return ContentType.UNKNOWN
 
 class BaseScraper:
     def __init__(self, url: str, config: Optional[Dict] = None):
         self.url = url
         self.config = config or {}
         self.content = WebContent(url=url)
+        # LRU cache of successful scrape results
+        self._result_cache: "OrderedDict[tuple, WebContent]" = OrderedDict()
+        self._cache_size = self.config.get("cache_size", 256)
     
-    async def detect_content_type(self) -> ContentType:
+    def _get_cached_result(self, key: tuple) -> Optional[WebContent]:
+        """Return a copy of a cached scrape result, if present"""
+        cached = self._result_cache.get(key)
+        if cached is None:
+            return None
+        self._result_cache.move_to_end(key)
+        return replace(cached)
+    
+    def _cache_result(self, key: tuple, content: WebContent) -> None:
+        """Store a scrape result, evicting the least recently used entry"""
+        self._result_cache[key] = content
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._cache_size:
+            self._result_cache.pop(next(iter(self._result_cache)))
+    
+    def detect_content_type(self, url: Optional[str] = None) -> ContentType:
         """Detect the type of content on the page"""
-        # Implement content type detection logic
-        # This is a simplified example - you'd want to make this more sophisticated
-        if "/product/" in self.url.lower():
-            return ContentType.PRODUCT
-        elif "/article/" in self.url.lower():
-            return ContentType.ARTICLE
-        return ContentType.UNKNOWN
+        return _detect_content_type_cached(url or self.url)
     
     async def extract_metadata(self, html: str) -> Dict:
         """Extract common metadata from HTML"""
@@ -63,6 +95,13 @@ class BaseScraper:
         """Extract structured data (JSON-LD, Microdata, RDFa)"""
         return None
     
-    async def scrape(self) -> WebContent:
-        """Main scraping method to be implemented by subclasses"""
+    async def scrape(self,
+                     use_llm: bool = False,
+                     content_type: Optional[ContentType] = None,
+                     url: Optional[str] = None) -> WebContent:
+        """Main scraping method to be implemented by subclasses
+
+        Implementations must scrape ``url`` (falling back to ``self.url``)
+        without reassigning ``self.url``, so a scraper can serve concurrent calls.
+        """
         raise NotImplementedError("Subclasses must implement this method")
\ No newline at end of file
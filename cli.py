@@ -1,9 +1,27 @@
 # crawler/cli.py
 import asyncio
-import json
 import argparse
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from scraper_factory import ScraperFactory
 from base_scraper import ContentType
+from json_utils import dumps
+
+logger = logging.getLogger(__name__)
+
+def _start_log_listener() -> QueueListener:
+    """Route CLI status messages through a queue so a background thread does the writes"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 async def main():
     parser = argparse.ArgumentParser(description="Web Scraper CLI with LLM Support")
@@ -22,8 +40,11 @@ async def main():
                        help="Follow links found in extracted data for deeper extraction")
     parser.add_argument("--max-links", type=int, default=3,
                        help="Maximum links to follow per page (default: 3)")
+    parser.add_argument("--fresh", action="store_true",
+                       help="Bypass the page cache and refetch every URL")
     args = parser.parse_args()
     
+    listener = _start_log_listener()
     try:
         # Parse content type
         content_type = None
@@ -34,6 +55,8 @@ async def main():
         config = {}
         if args.css_selector:
             config["css_selector"] = args.css_selector
+        if args.fresh:
+            config["fresh"] = True
         
         scraper = ScraperFactory.create_scraper(args.url, config=config)
         
@@ -41,7 +64,7 @@ async def main():
         async with scraper as s:
             if args.pagination:
                 # Scrape with pagination
-                print(f"Starting pagination scraping (max {args.max_pages} pages)...")
+                logger.info(f"Starting pagination scraping (max {args.max_pages} pages)...")
                 items = await s.scrape_with_pagination(
                     max_pages=args.max_pages,
                     use_llm=args.llm,
@@ -67,8 +90,8 @@ async def main():
                     "title": content.title,
                     "description": content.description,
                     "content_type": content.content_type.value,
-                    "content_length": len(content.content) if content.content else 0,
-                    "content_preview": content.content[:500] + "..." if content.content and len(content.content) > 500 else content.content,
+                    "content_length": len(content.content_bytes) if content.content_bytes else 0,
+                    "content_preview": content.content_bytes[:500].decode("utf-8", "ignore") + "..." if content.content_bytes and len(content.content_bytes) > 500 else content.content,
                     "llm_used": args.llm,
                     "structured_data_count": len(content.structured_data) if content.structured_data else 0
                 }
@@ -76,17 +99,21 @@ async def main():
                 # Add structured data if available
                 if content.structured_data:
                     result["structured_data"] = content.structured_data
-            
-            if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
-                print(f"Results saved to {args.output}")
-            else:
-                print(json.dumps(result, indent=2))
+        
+        # Written after the scraper is closed so its progress output is flushed
+        if args.output:
+            with open(args.output, "wb") as f:
+                f.write(dumps(result, indent=True))
+            logger.info(f"Results saved to {args.output}")
                 
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error(f"Error: {str(e)}")
         return 1
+    finally:
+        listener.stop()
+    
+    if not args.output:
+        print(dumps(result, indent=True).decode("utf-8"))
     
     return 0
 
@@ -16,7 +16,7 @@ async def example_basic_scraping():
     async with scraper as s:
         content = await s.scrape()
         print(f"Title: {content.title}")
-        print(f"Content length: {len(content.content) if content.content else 0}")
+        print(f"Content length: {len(content.content_bytes) if content.content_bytes else 0}")
         print(f"Content type: {content.content_type.value}")
 
 async def example_llm_scraping():
@@ -19,11 +19,15 @@ def install_dependencies():
         return False
     
     try:
-        # Install dependencies
+        # Install dependencies non-interactively, pip keeps using its own
+        # platform cache directory
         print("📦 Installing dependencies...")
+        env = dict(os.environ)
+        env.setdefault("PIP_NO_INPUT", "1")
+        env.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
         subprocess.run([
             sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], check=True)
+        ], check=True, env=env)
         
         print("✅ Dependencies installed successfully!")
         return True
@@ -52,13 +56,32 @@ def verify_installation():
         ("lxml", "LXML"),
     ]
     
+    # Probe every module in one fresh interpreter (so freshly installed
+    # packages are visible) using find_spec, which locates a module
+    # without executing it
+    modules = [module for module, _ in dependencies]
+    probe = (
+        "import importlib.util, sys\n"
+        f"for m in {modules!r}:\n"
+        "    sys.stdout.write(f'{m}:{importlib.util.find_spec(m) is not None}\\n')\n"
+    )
+    try:
+        output = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True, text=True, check=True
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Error verifying installation: {e}")
+        return False
+    
+    found = dict(line.split(":", 1) for line in output.splitlines() if ":" in line)
+    
     all_good = True
     
     for module, name in dependencies:
-        try:
-            __import__(module)
+        if found.get(module) == "True":
             print(f"✅ {name}")
-        except ImportError:
+        else:
             print(f"❌ {name} - Not found")
             all_good = False
     
@@ -0,0 +1,42 @@
+# crawler/json_utils.py
+"""
+JSON helpers that use orjson when it is installed and fall back to the
+standard library otherwise
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize
+        indent: Pretty-print with a two space indent
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str)
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=str
+    ).encode("utf-8")
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a string or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,13 +1,36 @@
 # crawler/llm_extraction.py
 import os
+import re
 import json
-from typing import Dict, List, Optional, Any, Type
+import hashlib
+import functools
+from typing import Dict, List, NamedTuple, Optional, Any, Type, Union
 from pydantic import BaseModel
 from crawl4ai import LLMExtractionStrategy
 from base_scraper import ContentType
+from json_utils import loads
 from dotenv import load_dotenv
 load_dotenv()
 
+class _EnvConfig(NamedTuple):
+    """LLM settings read from the environment"""
+    groq_api_key: Optional[str]
+    model: Optional[str]
+    gemini_api_key: Optional[str]
+
+@functools.lru_cache(maxsize=1)
+def _env_config() -> _EnvConfig:
+    """Read the LLM settings from the environment once"""
+    return _EnvConfig(
+        groq_api_key=os.getenv("GROQ_API_KEY"),
+        model=os.getenv("MODEL"),
+        gemini_api_key=os.getenv("GEMINI_API_KEY"),
+    )
+
+def clear_env_cache() -> None:
+    """Forget the cached environment so changed variables are picked up"""
+    _env_config.cache_clear()
+
 class GenericDataModel(BaseModel):
     """Generic data model for flexible content extraction"""
     title: Optional[str] = None
@@ -44,6 +67,29 @@ class ContactModel(BaseModel):
     address: Optional[str] = None
     website: Optional[str] = None
 
+@functools.cache
+def _schema_for(model_cls: Type[BaseModel]) -> dict:
+    """Get the JSON schema of a Pydantic model, generated once per class"""
+    return model_cls.model_json_schema()
+
+@functools.lru_cache(maxsize=32)
+def _build_strategy(
+    provider: Optional[str],
+    api_token: Optional[str],
+    model_cls: Type[BaseModel],
+    instruction: str
+) -> LLMExtractionStrategy:
+    """Build an LLM extraction strategy, reusing one per distinct configuration"""
+    return LLMExtractionStrategy(
+        provider=provider,
+        api_token=api_token,
+        schema=_schema_for(model_cls),
+        extraction_type="schema",
+        instruction=instruction,
+        input_format="markdown",
+        verbose=True,
+    )
+
 def get_llm_strategy_for_content_type(
     content_type: ContentType,
     custom_model: Optional[Type[BaseModel]] = None,
@@ -60,8 +106,8 @@ def get_llm_strategy_for_content_type(
     Returns:
         LLMExtractionStrategy or None if no API key is available
     """
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
+    env = _env_config()
+    if not env.groq_api_key:
         print("Warning: GROQ_API_KEY not found. LLM extraction will be skipped.")
         return None
     
@@ -72,44 +118,38 @@ def get_llm_strategy_for_content_type(
     else:
         model, instruction = _get_default_model_and_instruction(content_type)
     
-    return LLMExtractionStrategy(
-        provider=os.getenv("MODEL"),
-        api_token=os.getenv("GEMINI_API_KEY"),
-        schema=model.model_json_schema(),
-        extraction_type="schema",
-        instruction=instruction,
-        input_format="markdown",
-        verbose=True,
-    )
+    return _build_strategy(env.model, env.gemini_api_key, model, instruction)
+
+# Strategies are reused across pages; clears the cache of built strategies
+get_llm_strategy_for_content_type.cache_clear = lambda: _build_strategy.cache_clear()
+
+# Default extraction model and instruction per content type
+_DEFAULT_STRATEGY: Dict[ContentType, tuple[Type[BaseModel], str]] = {
+    ContentType.ARTICLE: (ArticleModel, (
+        "Extract article information including title, author, publish date, "
+        "main content, tags, and category from the following content."
+    )),
+    ContentType.PRODUCT: (ProductModel, (
+        "Extract product information including name, price, description, "
+        "rating, number of reviews, availability status, and image URLs "
+        "from the following content."
+    )),
+    ContentType.PROFILE: (ContactModel, (
+        "Extract contact information including name, email, phone, "
+        "address, and website from the following content."
+    )),
+}
+
+# Generic or unknown content
+_FALLBACK_STRATEGY: tuple[Type[BaseModel], str] = (GenericDataModel, (
+    "Extract general information including title, description, "
+    "main content, links, images, and any relevant metadata "
+    "from the following content."
+))
 
 def _get_default_model_and_instruction(content_type: ContentType) -> tuple[Type[BaseModel], str]:
     """Get default model and instruction for a content type"""
-    
-    if content_type == ContentType.ARTICLE:
-        return ArticleModel, (
-            "Extract article information including title, author, publish date, "
-            "main content, tags, and category from the following content."
-        )
-    
-    elif content_type == ContentType.PRODUCT:
-        return ProductModel, (
-            "Extract product information including name, price, description, "
-            "rating, number of reviews, availability status, and image URLs "
-            "from the following content."
-        )
-    
-    elif content_type == ContentType.PROFILE:
-        return ContactModel, (
-            "Extract contact information including name, email, phone, "
-            "address, and website from the following content."
-        )
-    
-    else:  # Generic or unknown content
-        return GenericDataModel, (
-            "Extract general information including title, description, "
-            "main content, links, images, and any relevant metadata "
-            "from the following content."
-        )
+    return _DEFAULT_STRATEGY.get(content_type, _FALLBACK_STRATEGY)
 
 def get_generic_llm_strategy(
     instruction: str = None,
@@ -125,7 +165,7 @@ def get_generic_llm_strategy(
     Returns:
         LLMExtractionStrategy or None if no API key
     """
-    api_key = os.getenv("GROQ_API_KEY")
+    api_key = _env_config().groq_api_key
     if not api_key:
         return None
     
@@ -140,25 +180,17 @@ def get_generic_llm_strategy(
             "and important details that would be valuable for analysis."
         )
     
-    return LLMExtractionStrategy(
-        provider="groq/deepseek-r1-distill-llama-70b",
-        api_token=api_key,
-        schema=model_class.model_json_schema(),
-        extraction_type="schema",
-        instruction=instruction,
-        input_format="markdown",
-        verbose=True,
-    )
+    return _build_strategy("groq/deepseek-r1-distill-llama-70b", api_key, model_class, instruction)
 
 def process_llm_extracted_data(
-    extracted_content: str,
+    extracted_content: Union[str, bytes, List[Dict]],
     content_type: ContentType
 ) -> List[Dict]:
     """
     Process and validate LLM extracted content.
     
     Args:
-        extracted_content: JSON string from LLM extraction
+        extracted_content: JSON string or already parsed items from LLM extraction
         content_type: Type of content that was extracted
         
     Returns:
@@ -169,7 +201,10 @@ def process_llm_extracted_data(
         if not extracted_content:
             return []
         
-        data = json.loads(extracted_content)
+        if isinstance(extracted_content, (str, bytes)):
+            data = loads(extracted_content)
+        else:
+            data = extracted_content
         if not data:
             return []
         
@@ -177,19 +212,16 @@ def process_llm_extracted_data(
         if not isinstance(data, list):
             data = [data]
         
-        processed_data = []
-        for item in data:
-            # Clean up the item
-            if isinstance(item, dict):
-                # Remove error keys if they're False
-                if item.get("error") is False:
-                    item.pop("error", None)
-                
-                # Validate that the item has meaningful content
-                if _is_valid_extracted_item(item, content_type):
-                    processed_data.append(item)
-        
-        return processed_data
+        # Keep items with meaningful content, dropping "error": False markers
+        # without mutating the parsed items
+        is_valid = _VALIDATORS.get(content_type, _is_valid_generic)
+        return [
+            item if item.get("error") is not False else {
+                key: value for key, value in item.items() if key != "error"
+            }
+            for item in data
+            if isinstance(item, dict) and is_valid(item)
+        ]
     
     except json.JSONDecodeError as e:
         print(f"Error parsing extracted content: {e}")
@@ -198,54 +230,109 @@ def process_llm_extracted_data(
         print(f"Error processing extracted data: {e}")
         return []
 
-def _is_valid_extracted_item(item: Dict, content_type: ContentType) -> bool:
-    """Check if an extracted item is valid based on content type"""
-    
-    if content_type == ContentType.ARTICLE:
-        return bool(item.get("title") and item.get("content"))
-    
-    elif content_type == ContentType.PRODUCT:
-        return bool(item.get("name"))
-    
-    elif content_type == ContentType.PROFILE:
-        return bool(item.get("name") or item.get("email") or item.get("phone"))
-    
-    else:  # Generic content
-        # Check if item has at least one meaningful field
-        meaningful_fields = ["title", "description", "content", "name"]
-        return any(item.get(field) for field in meaningful_fields)
+def _is_valid_article(item: Dict) -> bool:
+    return bool(item.get("title") and item.get("content"))
+
+def _is_valid_product(item: Dict) -> bool:
+    return bool(item.get("name"))
+
+def _is_valid_profile(item: Dict) -> bool:
+    return bool(item.get("name") or item.get("email") or item.get("phone"))
+
+def _is_valid_generic(item: Dict) -> bool:
+    # Check if item has at least one meaningful field
+    return any(item.get(field) for field in ("title", "description", "content", "name"))
+
+# Item validator per content type, generic content falls back to _is_valid_generic
+_VALIDATORS = {
+    ContentType.ARTICLE: _is_valid_article,
+    ContentType.PRODUCT: _is_valid_product,
+    ContentType.PROFILE: _is_valid_profile,
+}
+
+# Phrases that indicate a page has no results
+_DEFAULT_INDICATORS = (
+    "No Results Found",
+    "No results",
+    "Nothing found",
+    "0 results",
+    "No matches",
+    "No items found",
+    "Empty results",
+    "No data available"
+)
+
+@functools.lru_cache(maxsize=32)
+def _compile_indicators(indicators: tuple, binary: bool = False) -> re.Pattern:
+    """Compile no-results phrases into one case-insensitive alternation"""
+    pattern = "|".join(re.escape(indicator) for indicator in indicators)
+    if binary:
+        return re.compile(pattern.encode("utf-8"), re.IGNORECASE)
+    return re.compile(pattern, re.IGNORECASE)
 
 async def check_no_results_llm(
-    content: str,
+    content: Union[str, bytes],
     no_results_indicators: List[str] = None
 ) -> bool:
     """
     Use LLM to intelligently detect if a page indicates no results.
     
     Args:
-        content: The page content to analyze
+        content: The page content to analyze, as text or UTF-8 bytes
         no_results_indicators: List of phrases that indicate no results
         
     Returns:
         True if no results are detected, False otherwise
     """
-    if not no_results_indicators:
-        no_results_indicators = [
-            "No Results Found",
-            "No results",
-            "Nothing found",
-            "0 results",
-            "No matches",
-            "No items found",
-            "Empty results",
-            "No data available"
-        ]
+    # Search bytes directly so the page never has to be decoded
+    binary = isinstance(content, bytes)
+    indicators = tuple(sorted(no_results_indicators)) if no_results_indicators else _DEFAULT_INDICATORS
+    pattern = _compile_indicators(indicators, binary)
     
-    # Simple text-based check first
-    content_lower = content.lower()
-    for indicator in no_results_indicators:
-        if indicator.lower() in content_lower:
-            return True
+    # Simple text-based check first, a single case-insensitive scan
+    if pattern.search(content):
+        return True
     
     # Could be enhanced with LLM analysis for more sophisticated detection
     return False
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def content_fingerprint(content: str, shingle_size: int = 3) -> int:
+    """
+    Compute a 64-bit SimHash fingerprint of page content.
+    
+    Near-identical content produces fingerprints that differ in only a few
+    bits, which makes it cheap to detect pages that would yield the same
+    LLM extraction.
+    
+    Args:
+        content: The text to fingerprint
+        shingle_size: Number of consecutive words hashed together
+        
+    Returns:
+        The fingerprint as an integer
+    """
+    tokens = _TOKEN_RE.findall(content.lower())
+    if not tokens:
+        return 0
+    
+    shingles = {
+        " ".join(tokens[i:i + shingle_size])
+        for i in range(max(1, len(tokens) - shingle_size + 1))
+    }
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles
+    ]
+    
+    threshold = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(64):
+        if sum((h >> bit) & 1 for h in hashes) > threshold:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def fingerprint_similarity(a: int, b: int) -> float:
+    """Return the similarity of two fingerprints, from 0.0 to 1.0"""
+    return 1.0 - bin(a ^ b).count("1") / 64
@@ -1,8 +1,14 @@
 # scraper_factory.py
-from typing import Optional, Type
+from typing import Callable, Dict, Optional, Type
 from base_scraper import BaseScraper
 from async_web_crawler import AsyncWebScraper
 
+# Scraper implementations by type name, unknown types use the default
+_REGISTRY: Dict[str, Callable[[str, dict], BaseScraper]] = {
+    "default": AsyncWebScraper,
+    "crawl4ai": AsyncWebScraper,
+}
+
 class ScraperFactory:
     @staticmethod
     def create_scraper(
@@ -20,10 +26,30 @@ class ScraperFactory:
         Returns:
             An instance of a BaseScraper implementation
         """
-        config = config or {}
+        # Default to the async web crawler
+        return _REGISTRY.get(scraper_type, AsyncWebScraper)(url, config or {})
+    
+    @classmethod
+    async def warm_instance(
+        cls,
+        url: str = "about:blank",
+        scraper_type: str = "default",
+        config: Optional[dict] = None
+    ) -> BaseScraper:
+        """Create a scraper with its browser already started
         
-        if scraper_type == "crawl4ai":
-            return AsyncWebScraper(url, config)
+        Useful for sharing one browser across several independent tasks.
+        The caller owns the returned scraper and must close it with
+        ``await scraper.__aexit__(None, None, None)``.
         
-        # Default to the async web crawler
-        return AsyncWebScraper(url, config)
\ No newline at end of file
+        Args:
+            url: Default URL for the scraper
+            scraper_type: Type of scraper to create ('default', 'crawl4ai', etc.)
+            config: Configuration dictionary for the scraper
+            
+        Returns:
+            An initialized instance of a BaseScraper implementation
+        """
+        scraper = cls.create_scraper(url, scraper_type=scraper_type, config=config)
+        await scraper.__aenter__()
+        return scraper
\ No newline at end of file
@@ -4,7 +4,9 @@ Setup script for the Advanced Web Scraper module
 """
 from setuptools import setup, find_packages
 from setuptools.command.install import install
+import functools
 import os
+import pathlib
 import sys
 import subprocess
 
@@ -12,7 +14,8 @@ class PostInstallCommand(install):
     """Post-installation for installation mode."""
     def run(self):
         install.run(self)
-        # Install Playwright browsers
+        # Install Playwright browsers, playwright itself skips any browser
+        # already downloaded at the revision it needs
         try:
             print("Installing Playwright browsers...")
             subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium", "--with-deps"])
@@ -22,15 +25,12 @@ class PostInstallCommand(install):
             sys.exit(1)
 
 # Read the requirements file
+@functools.cache
 def read_requirements():
     requirements_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
-    with open(requirements_path, 'r') as f:
-        requirements = []
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                requirements.append(line)
-    return requirements
+    text = pathlib.Path(requirements_path).read_text()
+    lines = (line.strip() for line in text.splitlines())
+    return [line for line in lines if line and not line.startswith('#')]
 
 # Read the README file
 def read_readme():
@@ -51,7 +51,7 @@ setup(
     url="https://github.com/yourusername/advanced-web-scraper",
     packages=find_packages(),
     install_requires=read_requirements(),
-    python_requires=">=3.8",
+    python_requires=">=3.11",
     cmdclass={
         'install': PostInstallCommand,
     },
@@ -61,9 +61,6 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Topic :: Internet :: WWW/HTTP :: Indexing/Search",
@@ -84,12 +81,15 @@ setup(
             "flake8",
             "mypy",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "ui": [
-            "streamlit>=1.28.0",
+            "streamlit>=1.37.0",
             "plotly>=5.17.0",
             "pandas>=2.0.0",
+            "numpy>=1.24.0",
         ],
     },
-    include_package_data=True,
     zip_safe=False,
 )
@@ -1,14 +1,21 @@
 # crawler/streamlit_app.py
 import streamlit as st
 import asyncio
+import html
 import json
 import os
+import queue
+import re
+import threading
+import time
 from datetime import datetime
-import pandas as pd
-from scraper_factory import ScraperFactory
+from textwrap import shorten
+from urllib.parse import urlsplit
 from base_scraper import ContentType
-import plotly.express as px
-import plotly.graph_objects as go
+from json_utils import dumps
+
+# pandas, numpy, plotly and the scraper (crawl4ai, playwright) are imported
+# where they are used, so the first page renders without loading them
 
 # Page configuration
 st.set_page_config(
@@ -39,6 +46,11 @@ st.markdown("""
         margin: 0.5rem 0;
     }
     
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    
     .metric-card {
         background: #f8f9fa;
         padding: 1rem;
@@ -47,6 +59,11 @@ st.markdown("""
         margin: 0.5rem 0;
     }
     
+    .metric-row .metric-card {
+        flex: 1;
+        overflow-wrap: anywhere;
+    }
+    
     .success-box {
         background: #d4edda;
         border: 1px solid #c3e6cb;
@@ -67,6 +84,39 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Only the scheme is matched here, urlsplit is left to parse the host so
+# credentials, ports and bracketed IPv6 addresses are accepted
+_URL_RE = re.compile(r'^https?://\S+$', re.IGNORECASE)
+
+def _is_valid_url(url):
+    """Check for an http(s) URL with a host"""
+    if not _URL_RE.match(url):
+        return False
+    try:
+        return bool(urlsplit(url).hostname)
+    except ValueError:
+        # Malformed bracketed hosts, e.g. an unclosed IPv6 address
+        return False
+
+# Minimum seconds between progress widget refreshes while scraping
+_PROGRESS_INTERVAL = 0.1
+
+def _latest_update(updates, timeout):
+    """Wait up to ``timeout`` for progress updates and keep only the newest"""
+    latest = None
+    try:
+        latest = updates.get(timeout=timeout) if timeout else updates.get_nowait()
+        while True:
+            latest = updates.get_nowait()
+    except queue.Empty:
+        pass
+    return latest
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _api_status():
+    """Whether the API key and model are configured, rechecked once a minute"""
+    return (bool(os.environ.get("GEMINI_API_KEY")), bool(os.environ.get("MODEL")))
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">🕷️ Advanced Web Scraper with LLM</h1>', unsafe_allow_html=True)
@@ -101,6 +151,10 @@ def main():
         follow_links = st.checkbox("🔗 Follow links for deeper extraction", value=False)
         max_links = st.slider("🔢 Max links per page", min_value=1, max_value=10, value=3)
         
+        # Concurrency
+        concurrency = st.slider("⚡ Max concurrent requests", min_value=1, max_value=50, value=10,
+                                help="Pages and links fetched by the browser at the same time")
+        
         # CSS Selector
         css_selector = st.text_input("🎯 CSS Selector (optional)", placeholder=".content, #main")
         
@@ -110,14 +164,13 @@ def main():
         
         # API Key check
         st.subheader("🔑 API Configuration")
-        gemini_key = os.getenv("GEMINI_API_KEY")
-        if gemini_key:
+        has_key, has_model = _api_status()
+        if has_key:
             st.success("✅ GEMINI API Key found")
         else:
             st.warning("⚠️ GEMINI API Key not found. LLM features will be limited.")
             st.info("Set your API key: `export GEMINI_API_KEY='your-key'`")
-        model = os.getenv("MODEL")
-        if model:
+        if has_model:
             st.success("✅ Model found")
         else:
             st.warning("⚠️ Model not found. LLM features will be limited.")
@@ -139,35 +192,31 @@ def main():
             if st.button("🧹 Clear Results", use_container_width=True):
                 if 'scraping_results' in st.session_state:
                     del st.session_state.scraping_results
+                st.session_state.pop('scraping_stats', None)
+                st.session_state._download_pending = False
                 st.rerun()
         
         with col_btn3:
             if st.button("💾 Download Results", use_container_width=True):
-                if 'scraping_results' in st.session_state:
-                    st.download_button(
-                        label="📥 Download JSON",
-                        data=json.dumps(st.session_state.scraping_results, indent=2),
-                        file_name=f"scraping_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                        mime="application/json"
-                    )
+                st.session_state._download_pending = True
+            
+            # Serialize only once a download was asked for, not on every rerun
+            if st.session_state.get('_download_pending') and 'scraping_results' in st.session_state:
+                results = st.session_state.scraping_results
+                st.download_button(
+                    label="📥 Download JSON",
+                    data=_serialize_results(_results_key(results), results),
+                    file_name=f"scraping_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
     
     with col2:
-        st.subheader("📊 Quick Stats")
-        if 'scraping_results' in st.session_state:
-            results = st.session_state.scraping_results
-            
-            if results.get('scraping_mode') == 'pagination':
-                st.metric("📄 Total Items", results.get('total_items', 0))
-                st.metric("🧠 LLM Used", "Yes" if results.get('llm_used') else "No")
-                st.metric("🔗 Links Followed", "Yes" if follow_links else "No")
-            else:
-                st.metric("📝 Title Length", len(results.get('title', '')))
-                st.metric("📄 Content Length", results.get('content_length', 0))
-                st.metric("🔍 Structured Items", results.get('structured_data_count', 0))
+        _render_quick_stats(follow_links)
     
     # Scraping execution
+    url = url.strip()
     if scrape_button and url:
-        if not url.startswith(('http://', 'https://')):
+        if not _is_valid_url(url):
             st.error("❌ Please enter a valid URL starting with http:// or https://")
             return
         
@@ -181,7 +230,15 @@ def main():
                 status_text.text("🚀 Initializing scraper...")
                 progress_bar.progress(20)
                 
-                results = asyncio.run(run_scraping(
+                status_text.text("🔧 Creating scraper...")
+                progress_bar.progress(40)
+                scraper = _scraper_for(url, css_selector if css_selector else None, headless, concurrency)
+                
+                # The scrape runs on the background loop, progress updates come
+                # back through a queue since widgets must be updated from here
+                updates = queue.SimpleQueue()
+                future = asyncio.run_coroutine_threadsafe(run_scraping(
+                    scraper=scraper,
                     url=url,
                     use_llm=use_llm,
                     content_type=ContentType(content_type),
@@ -189,16 +246,37 @@ def main():
                     max_pages=max_pages,
                     follow_links=follow_links,
                     max_links=max_links,
-                    css_selector=css_selector if css_selector else None,
-                    headless=headless,
-                    progress_callback=lambda p, msg: (progress_bar.progress(p), status_text.text(msg))
-                ))
+                    concurrency=concurrency,
+                    progress_callback=lambda p, msg: updates.put((p, msg))
+                ), _event_loop())
+                
+                # Widgets are refreshed at most every _PROGRESS_INTERVAL seconds
+                # with the latest update, however often the scraper reports
+                last_shown = 0.0
+                pending = None
+                while True:
+                    # Checked before draining so no update queued before the
+                    # scrape finished is left behind
+                    done = future.done()
+                    pending = _latest_update(updates, 0 if done else _PROGRESS_INTERVAL) or pending
+                    now = time.monotonic()
+                    if pending and (done or now - last_shown >= _PROGRESS_INTERVAL):
+                        p, msg = pending
+                        progress_bar.progress(p)
+                        status_text.text(msg)
+                        pending = None
+                        last_shown = now
+                    if done:
+                        break
+                results = future.result()
             
                 progress_bar.progress(100)
                 status_text.text("✅ Scraping completed!")
                 
-                # Store results in session state
+                # Store results in session state, with the Quick Stats
+                # numbers computed once here instead of on every rerun
                 st.session_state.scraping_results = results
+                st.session_state.scraping_stats = _scraping_stats(results)
                 
                 # Show success message
                 st.markdown('<div class="success-box">🎉 Scraping completed successfully!</div>', unsafe_allow_html=True)
@@ -212,34 +290,94 @@ def main():
     if 'scraping_results' in st.session_state:
         display_results(st.session_state.scraping_results)
 
-async def run_scraping(url, use_llm, content_type, use_pagination, max_pages, 
-                      follow_links, max_links, css_selector, headless, progress_callback):
-    """Run the scraping operation"""
+# Caches of per-run payloads are shared by all sessions, keep only recent runs
+_RESULTS_CACHE_ENTRIES = 16
+
+def _results_key(results):
+    """Cache key identifying one scraping run's results"""
+    return (id(results), results.get('timestamp'))
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _serialize_results(results_key, _results):
+    """Encode results for download, once per results object"""
+    # _results isn't hashed, results_key identifies the run instead
+    return dumps(_results, indent=True)
+
+@st.cache_resource(show_spinner=False)
+def _event_loop():
+    """Event loop kept running in a background thread for the app's lifetime"""
+    # asyncio.run would build and tear down a loop on every click
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="scraper-loop", daemon=True).start()
+    return loop
+
+def _scraper_for(url, css_selector, headless, concurrency):
+    """Build a fresh scraper for the sidebar settings"""
+    from scraper_factory import ScraperFactory
     
     # Configure scraper
     config = {
         "browser_config": {
             "headless": headless,
             "verbose": False
-        }
+        },
+        # Sized to the slider so the shared semaphore is the real limit
+        "max_concurrency": concurrency,
+        "link_concurrency": concurrency
     }
     
     if css_selector:
         config["css_selector"] = css_selector
     
-    progress_callback(40, "🔧 Creating scraper...")
-    scraper = ScraperFactory.create_scraper(url, config=config)
+    # Each run gets its own scraper, so sessions never share a browser or
+    # its tabs, and its caches only live as long as the run
+    return ScraperFactory.create_scraper(url, config=config)
+
+@st.fragment
+def _render_quick_stats(follow_links):
+    """Quick Stats panel, reading the latest stats from session state"""
+    st.subheader("📊 Quick Stats")
+    if 'scraping_stats' in st.session_state:
+        stats = st.session_state.scraping_stats
+        
+        if stats["mode"] == 'pagination':
+            st.metric("📄 Total Items", stats["total_items"])
+            st.metric("🧠 LLM Used", "Yes" if stats["llm_used"] else "No")
+            st.metric("🔗 Links Followed", "Yes" if follow_links else "No")
+        else:
+            st.metric("📝 Title Length", stats["title_len"])
+            st.metric("📄 Content Length", stats["content_len"])
+            st.metric("🔍 Structured Items", stats["struct_count"])
+
+def _scraping_stats(results):
+    """Summary numbers shown in Quick Stats for one scraping run"""
+    return {
+        "mode": results.get('scraping_mode'),
+        "total_items": results.get('total_items', 0),
+        "llm_used": bool(results.get('llm_used')),
+        "title_len": len(results.get('title') or ''),
+        "content_len": results.get('content_length', 0),
+        "struct_count": results.get('structured_data_count', 0)
+    }
+
+async def run_scraping(scraper, url, use_llm, content_type, use_pagination, max_pages, 
+                      follow_links, max_links, concurrency, progress_callback):
+    """Run the scraping operation"""
+    # Created here so it belongs to the loop the scrape runs on
+    sem = asyncio.Semaphore(concurrency)
     
     progress_callback(60, "🕷️ Starting extraction...")
     
     async with scraper as s:
         if use_pagination:
             items = await s.scrape_with_pagination(
+                base_url=url,
                 max_pages=max_pages,
                 use_llm=use_llm,
                 content_type=content_type,
                 follow_links=follow_links,
-                max_links_per_page=max_links
+                max_links_per_page=max_links,
+                semaphore=sem
             )
             
             return {
@@ -253,154 +391,276 @@ async def run_scraping(url, use_llm, content_type, use_pagination, max_pages,
                 "timestamp": datetime.now().isoformat()
             }
         else:
-            content = await s.scrape(use_llm=use_llm, content_type=content_type)
+            content = await s.scrape(use_llm=use_llm, content_type=content_type, url=url)
             
             return {
                 "url": content.url,
                 "title": content.title,
                 "description": content.description,
                 "content_type": content.content_type.value,
-                "content_length": len(content.content) if content.content else 0,
+                "content_length": len(content.content_bytes) if content.content_bytes else 0,
                 "llm_used": use_llm,
                 "structured_data_count": len(content.structured_data) if content.structured_data else 0,
                 "structured_data": content.structured_data,
                 "timestamp": datetime.now().isoformat()
             }
 
-def display_results(results):
-    """Display scraping results in a nice format"""
+# The display helpers take items as a JSON string, a stable key for st.cache_data,
+# so tables and figures are only rebuilt when the results change
+
+# Shared default for missing list fields, avoids allocating a list per miss
+_EMPTY = ()
+# Item list fields counted for the summary table and charts
+_COUNT_KEYS = ('links', 'images', 'extracted_from_links')
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _summary_df(items_json):
+    """Build the per-item summary table"""
+    import pandas as pd
     
-    st.header("📊 Scraping Results")
+    items = json.loads(items_json)
+    counts = _item_counts(items_json)
+    # Built column by column so truncation runs as vectorized string ops
+    df = pd.DataFrame({
+        "Title": [item.get('title') or 'N/A' for item in items],
+        "Links": counts['links'],
+        "Images": counts['images'],
+        "Deep Links": counts['extracted_from_links']
+    })
+    df.insert(0, "Item #", range(1, len(df) + 1))
+    titles = df["Title"].astype(str)
+    df["Title"] = titles.str.slice(0, 50) + titles.str.len().gt(50).map({True: "...", False: ""})
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _item_counts(items_json):
+    """Length of each list field for every item, as one int array per field"""
+    import numpy as np
     
-    # Create tabs for different views
-    tab1, tab2, tab3, tab4 = st.tabs(["📋 Overview", "📄 Raw Data", "📊 Analytics", "🔍 Deep Links"])
+    items = json.loads(items_json)
+    # Computed once per result set and shared by the table and every chart.
+    # A single pass fills one (items, fields) array, each field is a column view
+    counts = np.fromiter(
+        (tuple(len(item.get(key) or _EMPTY) for key in _COUNT_KEYS) for item in items),
+        dtype=np.dtype((np.int32, len(_COUNT_KEYS))),
+        count=len(items)
+    )
+    return dict(zip(_COUNT_KEYS, counts.T))
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _analytics_figure(items_json):
+    """All analytics charts as subplots of one figure, mounted by a single chart"""
+    import numpy as np
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
     
-    with tab1:
-        st.subheader("📋 Overview")
+    counts = _item_counts(items_json)
+    deep_arr = counts['extracted_from_links']
+    # The deep links chart is only shown when some links were followed
+    has_deep = deep_arr.any()
+    charts = [
+        ("Distribution of Links per Item", "Number of Links"),
+        ("Distribution of Images per Item", "Number of Images"),
+    ]
+    if has_deep:
+        charts.append(("Deep Links Extracted per Item", "Item Number"))
+    
+    fig = make_subplots(rows=len(charts), cols=1, subplot_titles=[title for title, _ in charts])
+    
+    # Histograms are binned here, sending bin totals keeps the figure small
+    # however many items there are
+    for row, key in enumerate(('links', 'images'), start=1):
+        totals = np.bincount(counts[key])
+        fig.add_trace(go.Bar(x=np.arange(len(totals)), y=totals), row=row, col=1)
+        fig.update_yaxes(title_text="Count", row=row, col=1)
+    
+    if has_deep:
+        fig.add_trace(go.Bar(x=np.arange(1, len(deep_arr) + 1), y=deep_arr), row=3, col=1)
+        fig.update_yaxes(title_text="Deep Links Count", row=3, col=1)
+    
+    for row, (_, x_title) in enumerate(charts, start=1):
+        fig.update_xaxes(title_text=x_title, row=row, col=1)
+    
+    fig.update_layout(height=300 * len(charts), showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _deep_links_table(items_json):
+    """One row per followed link, with the structured data of each row"""
+    import pandas as pd
+    
+    rows = []
+    structured = []
+    for i, item in enumerate(json.loads(items_json)):
+        for j, link_data in enumerate(item.get('extracted_from_links') or _EMPTY):
+            link_items = link_data.get('structured_data') or _EMPTY
+            rows.append({
+                "Item": i + 1,
+                "Item Title": item.get('title') or 'N/A',
+                "Link #": j + 1,
+                "URL": link_data.get('url') or 'N/A',
+                "Title": link_data.get('title') or 'N/A',
+                "Description": link_data.get('description') or '',
+                "Content Length": link_data.get('content_length', 0),
+                "Structured Items": len(link_items)
+            })
+            structured.append(link_items)
+    return pd.DataFrame(rows), structured
+
+@st.cache_data(show_spinner=False, max_entries=_RESULTS_CACHE_ENTRIES)
+def _short_description(run_key, _description):
+    """Description cut to 200 characters on a word boundary, once per run"""
+    short = shorten(_description, width=200, placeholder="...")
+    # With no space in the first 200 characters shorten keeps nothing but
+    # the placeholder, so cut mid-word instead
+    if short.strip() in ("", "...") and _description.strip():
+        return _description[:200] + "..."
+    return short
+
+# Serialized results larger than this are previewed instead of shown as a JSON tree
+_RAW_PREVIEW_BYTES = 200_000
+
+# Each tab renders in its own fragment, so interacting with one tab
+# reruns only that tab instead of the whole script
+
+@st.fragment
+def _render_overview(results, items_json):
+    """Overview tab: run summary and mode-specific details"""
+    st.subheader("📋 Overview")
+    
+    # Basic info, all three cards in one element
+    cards = (
+        ("🌐 URL", results.get('url') or 'N/A'),
+        ("📅 Timestamp", (results.get('timestamp') or 'N/A')[:19]),
+        ("🤖 LLM Used", "Yes" if results.get('llm_used') else "No"),
+    )
+    st.markdown(
+        '<div class="metric-row">' + "".join(
+            f'<div class="metric-card"><b>{label}</b><br>{html.escape(str(value))}</div>'
+            for label, value in cards
+        ) + '</div>',
+        unsafe_allow_html=True
+    )
+    
+    # Mode-specific display
+    if results.get('scraping_mode') == 'pagination':
+        st.subheader("📄 Pagination Results")
+        
+        items = results.get('items', [])
+        if items:
+            # Create a summary table
+            st.dataframe(_summary_df(items_json), use_container_width=True)
+        else:
+            st.info("No items extracted")
+    
+    else:
+        st.subheader("📄 Single Page Results")
         
-        # Basic info
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("🌐 URL", "", results.get('url', 'N/A'))
-            st.markdown('</div>', unsafe_allow_html=True)
+            st.write("**Title:**", results.get('title', 'N/A'))
+            st.write("**Content Type:**", results.get('content_type', 'N/A'))
+            st.write("**Content Length:**", results.get('content_length', 0))
         
         with col2:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("📅 Timestamp", "", results.get('timestamp', 'N/A')[:19])
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("🤖 LLM Used", "", "Yes" if results.get('llm_used') else "No")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Mode-specific display
-        if results.get('scraping_mode') == 'pagination':
-            st.subheader("📄 Pagination Results")
-            
-            items = results.get('items', [])
-            if items:
-                # Create a summary table
-                summary_data = []
-                for i, item in enumerate(items):
-                    summary_data.append({
-                        "Item #": i + 1,
-                        "Title": item.get('title', 'N/A')[:50] + "..." if len(item.get('title', '')) > 50 else item.get('title', 'N/A'),
-                        "Links": len(item.get('links', [])),
-                        "Images": len(item.get('images', [])),
-                        "Deep Links": len(item.get('extracted_from_links', []))
-                    })
-                
-                df = pd.DataFrame(summary_data)
-                st.dataframe(df, use_container_width=True)
-            else:
-                st.info("No items extracted")
-        
-        else:
-            st.subheader("📄 Single Page Results")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**Title:**", results.get('title', 'N/A'))
-                st.write("**Content Type:**", results.get('content_type', 'N/A'))
-                st.write("**Content Length:**", results.get('content_length', 0))
-            
-            with col2:
-                st.write("**Description:**", results.get('description', 'N/A')[:200] + "..." if len(results.get('description', '')) > 200 else results.get('description', 'N/A'))
-                st.write("**Structured Items:**", results.get('structured_data_count', 0))
+            st.write("**Description:**", _short_description(
+                (results.get('url'), results.get('timestamp')), results.get('description') or 'N/A'
+            ))
+            st.write("**Structured Items:**", results.get('structured_data_count', 0))
+
+@st.fragment
+def _render_raw(results):
+    """Raw Data tab: the full results as JSON"""
+    st.subheader("📄 Raw Data")
     
-    with tab2:
-        st.subheader("📄 Raw Data")
-        
+    payload = _serialize_results(_results_key(results), results)
+    if len(payload) > _RAW_PREVIEW_BYTES:
+        # The interactive JSON tree is slow to render for large payloads,
+        # show a plain highlighted preview and offer the rest as a download
+        st.info(f"Results are {len(payload):,} bytes, showing the first {_RAW_PREVIEW_BYTES:,}. "
+                "Download the JSON for the full data.")
+        st.code(payload[:_RAW_PREVIEW_BYTES].decode('utf-8', errors='replace'), language='json')
+        st.download_button(
+            label="📥 Download full JSON",
+            data=payload,
+            file_name=f"scraping_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json",
+            key="raw_data_download"
+        )
+    else:
         # JSON display with syntax highlighting
         st.json(results)
+
+@st.fragment
+def _render_analytics(results, items_json):
+    """Analytics tab: per-item charts for pagination runs"""
+    st.subheader("📊 Analytics")
     
-    with tab3:
-        st.subheader("📊 Analytics")
-        
-        if results.get('scraping_mode') == 'pagination':
-            items = results.get('items', [])
-            if items:
-                # Create analytics charts
-                
-                # Links distribution
-                links_data = [len(item.get('links', [])) for item in items]
-                fig_links = px.histogram(x=links_data, title="Distribution of Links per Item", 
-                                       labels={'x': 'Number of Links', 'y': 'Count'})
-                st.plotly_chart(fig_links, use_container_width=True)
-                
-                # Images distribution
-                images_data = [len(item.get('images', [])) for item in items]
-                fig_images = px.histogram(x=images_data, title="Distribution of Images per Item",
-                                        labels={'x': 'Number of Images', 'y': 'Count'})
-                st.plotly_chart(fig_images, use_container_width=True)
-                
-                # Deep links analysis
-                if any(item.get('extracted_from_links') for item in items):
-                    deep_links_data = [len(item.get('extracted_from_links', [])) for item in items]
-                    fig_deep = px.bar(x=range(1, len(deep_links_data) + 1), y=deep_links_data,
-                                     title="Deep Links Extracted per Item",
-                                     labels={'x': 'Item Number', 'y': 'Deep Links Count'})
-                    st.plotly_chart(fig_deep, use_container_width=True)
-            else:
-                st.info("No data available for analytics")
+    if results.get('scraping_mode') == 'pagination':
+        items = results.get('items', [])
+        if items:
+            # Links, images and deep links distributions in one chart
+            st.plotly_chart(_analytics_figure(items_json), use_container_width=True)
         else:
-            st.info("Analytics are available for pagination mode only")
+            st.info("No data available for analytics")
+    else:
+        st.info("Analytics are available for pagination mode only")
+
+@st.fragment
+def _render_deep_links(results, items_json):
+    """Deep Links tab: data extracted from followed links"""
+    st.subheader("🔍 Deep Links Analysis")
     
-    with tab4:
-        st.subheader("🔍 Deep Links Analysis")
+    if results.get('scraping_mode') == 'pagination':
+        df, structured = _deep_links_table(items_json)
         
-        if results.get('scraping_mode') == 'pagination':
-            items = results.get('items', [])
-            deep_link_items = [item for item in items if item.get('extracted_from_links')]
-            
-            if deep_link_items:
-                for i, item in enumerate(deep_link_items):
-                    with st.expander(f"🔗 Item {i+1}: {item.get('title', 'Untitled')[:50]}..."):
-                        
-                        st.write("**Original Item:**")
-                        st.write(f"- Title: {item.get('title', 'N/A')}")
-                        st.write(f"- Description: {item.get('description', 'N/A')[:100]}...")
-                        
-                        st.write("**Extracted from Links:**")
-                        for j, link_data in enumerate(item.get('extracted_from_links', [])):
-                            st.write(f"**Link {j+1}:** {link_data.get('url', 'N/A')}")
-                            st.write(f"- Title: {link_data.get('title', 'N/A')}")
-                            st.write(f"- Description: {link_data.get('description', 'N/A')}")
-                            st.write(f"- Content Length: {link_data.get('content_length', 0)}")
-                            
-                            if link_data.get('structured_data'):
-                                st.write(f"- Structured Data Items: {len(link_data['structured_data'])}")
-                                with st.expander(f"View structured data from link {j+1}"):
-                                    st.json(link_data['structured_data'])
-                            st.write("---")
+        if len(df):
+            # One table for every followed link, selecting a row shows its data
+            event = st.dataframe(
+                df,
+                use_container_width=True,
+                hide_index=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key="deep_links_table"
+            )
+            selected = event.selection.rows
+            if selected:
+                row = selected[0]
+                if structured[row]:
+                    st.write(f"**Structured data from {df.at[row, 'URL']}:**")
+                    st.json(structured[row])
+                else:
+                    st.info("No structured data was extracted from this link")
             else:
-                st.info("No deep link extraction data available")
+                st.caption("Select a row to view the structured data extracted from that link")
         else:
-            st.info("Deep link analysis is available for pagination mode only")
+            st.info("No deep link extraction data available")
+    else:
+        st.info("Deep link analysis is available for pagination mode only")
+
+def display_results(results):
+    """Display scraping results in a nice format"""
+    
+    st.header("📊 Scraping Results")
+    
+    items_json = json.dumps(results.get('items', []), sort_keys=True, default=str)
+    
+    # Create tabs for different views
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Overview", "📄 Raw Data", "📊 Analytics", "🔍 Deep Links"])
+    
+    with tab1:
+        _render_overview(results, items_json)
+    
+    with tab2:
+        _render_raw(results)
+    
+    with tab3:
+        _render_analytics(results, items_json)
+    
+    with tab4:
+        _render_deep_links(results, items_json)
 
 if __name__ == "__main__":
     main()